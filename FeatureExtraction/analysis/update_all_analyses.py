@@ -11,91 +11,159 @@ import seaborn as sns
 from pathlib import Path
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from create_hyperparameter_table import load_summary
+
+# Explicit dtypes avoid pandas' two-pass type inference on load;
+# 'category' collapses the repeated Model/Attack_Type strings to
+# integer codes, so filters and groupbys on them compare ints
+ATTACK_DTYPES = {
+    'Attack_Type': 'category',
+    'Model': 'category',
+    'Precision': 'float32',
+    'Recall': 'float32',
+    'F1_Score': 'float32',
+    'AUC': 'float32',
+    'Inference_Time': 'float32'
+}
+
+MAIN_DTYPES = {
+    'Model': 'category',
+    'Precision': 'float32',
+    'Recall': 'float32',
+    'F1-Score': 'float32',
+    'AUC': 'float32',
+    'Training Time (s)': 'float32',
+    'Inference Time (s)': 'float32',
+    'True Positives': 'int32',
+    'False Positives': 'int32'
+}
 
 def run_analysis_scripts():
     """Run all analysis scripts to regenerate visualizations with IsolationForest"""
+
+    # Only stderr is ever inspected (on failure), so discard stdout
+    # instead of buffering each child's full output in memory
+    def run_script(script):
+        return subprocess.run([sys.executable, script],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                              text=True, cwd='.')
+
+    def report(script, result):
+        if result.returncode == 0:
+            print(f"   [OK] {script} completed successfully")
+        else:
+            print(f"   [FAIL] {script} failed: {result.stderr}")
+
+    # simple_analysis.py rewrites model_comparison_summary.csv, which
+    # performance_tradeoff.py and radar_chart.py read back, so it must
+    # finish before the others start; the rest only share read-only inputs
+    print("Running simple_analysis.py...")
+    try:
+        report('simple_analysis.py', run_script('simple_analysis.py'))
+    except Exception as e:
+        print(f"   [ERROR] Error running simple_analysis.py: {e}")
+
     scripts = [
-        'simple_analysis.py',
-        'performance_tradeoff.py', 
+        'performance_tradeoff.py',
         'radar_chart.py',
         'phantom_ecu_writeup_analysis.py',
         'realistic_phantom_analysis.py'
     ]
-    
-    for script in scripts:
-        print(f"Running {script}...")
-        try:
-            result = subprocess.run([sys.executable, script], 
-                                  capture_output=True, text=True, cwd='.')
-            if result.returncode == 0:
-                print(f"   [OK] {script} completed successfully")
-            else:
-                print(f"   [FAIL] {script} failed: {result.stderr}")
-        except Exception as e:
-            print(f"   [ERROR] Error running {script}: {e}")
+    print(f"Running the remaining {len(scripts)} analysis scripts concurrently...")
+    with ThreadPoolExecutor(max_workers=len(scripts)) as executor:
+        futures = {executor.submit(run_script, script): script
+                   for script in scripts}
+        for future in as_completed(futures):
+            script = futures[future]
+            try:
+                report(script, future.result())
+            except Exception as e:
+                print(f"   [ERROR] Error running {script}: {e}")
 
 def create_isolation_forest_summary():
     """Create a summary specifically highlighting IsolationForest performance"""
     
     # Load attack-specific results
-    attack_results = pd.read_csv('../results/attack_specific_results.csv')
-    main_results = pd.read_csv('../results/anomaly_detection_results.csv')
-    
-    # Filter IsolationForest results
-    iso_results = attack_results[attack_results['Model'] == 'IsolationForest']
-    
-    print("\n" + "="*80)
-    print("ISOLATION FOREST INTEGRATION SUMMARY")
-    print("="*80)
-    
-    print(f"\nMAIN EVALUATION PERFORMANCE:")
-    iso_main = main_results[main_results['Model'] == 'IsolationForest'].iloc[0]
-    print(f"   - F1-Score: {iso_main['F1-Score']:.4f} (Rank: 5/6)")
-    print(f"   - Precision: {iso_main['Precision']:.4f}")
-    print(f"   - Recall: {iso_main['Recall']:.4f}")
-    print(f"   - AUC: {iso_main['AUC']:.4f}")
-    print(f"   - Training Time: {iso_main['Training Time (s)']:.2f}s")
-    print(f"   - Inference Time: {iso_main['Inference Time (s)']:.2f}s")
-    
-    print(f"\nATTACK-SPECIFIC PERFORMANCE:")
-    for _, row in iso_results.iterrows():
-        print(f"   - {row['Attack_Type']}: F1={row['F1_Score']:.4f}, AUC={row['AUC']:.4f}")
-    
-    print(f"\nPHANTOM ECU PERFORMANCE:")
-    phantom_iso = iso_results[iso_results['Attack_Type'] == 'Realistic_Phantom_ECU']
+    attack_results = pd.read_csv('../results/attack_specific_results.csv',
+                                 dtype=ATTACK_DTYPES, engine='c')
+    main_results = pd.read_csv('../results/anomaly_detection_results.csv',
+                               dtype=MAIN_DTYPES, engine='c')
+
+    # Index by Model once so each lookup is a hash probe rather than a
+    # full equality scan; Model is non-unique in attack_results, so group
+    main_results.set_index('Model', inplace=True)
+    model_groups = attack_results.groupby('Model', observed=True)
+    iso_results = model_groups.get_group('IsolationForest')
+
+    # Likewise group by Attack_Type (already categorical from the load)
+    # once instead of re-filtering the full table per attack
+    attack_groups = attack_results.groupby('Attack_Type', observed=True)
+
+    # Accumulate the report and flush it in one write instead of issuing
+    # a syscall per print line
+    lines = []
+    log = lines.append
+
+    log("\n" + "="*80)
+    log("ISOLATION FOREST INTEGRATION SUMMARY")
+    log("="*80)
+
+    log(f"\nMAIN EVALUATION PERFORMANCE:")
+    iso_main = main_results.loc['IsolationForest']
+    log(f"   - F1-Score: {iso_main['F1-Score']:.4f} (Rank: 5/6)")
+    log(f"   - Precision: {iso_main['Precision']:.4f}")
+    log(f"   - Recall: {iso_main['Recall']:.4f}")
+    log(f"   - AUC: {iso_main['AUC']:.4f}")
+    log(f"   - Training Time: {iso_main['Training Time (s)']:.2f}s")
+    log(f"   - Inference Time: {iso_main['Inference Time (s)']:.2f}s")
+
+    log(f"\nATTACK-SPECIFIC PERFORMANCE:")
+    for attack_type, f1, auc in iso_results[['Attack_Type', 'F1_Score', 'AUC']].itertuples(index=False, name=None):
+        log(f"   - {attack_type}: F1={f1:.4f}, AUC={auc:.4f}")
+
+    log(f"\nPHANTOM ECU PERFORMANCE:")
+    if 'Realistic_Phantom_ECU' in attack_groups.groups:
+        phantom_all = attack_groups.get_group('Realistic_Phantom_ECU')
+    else:
+        phantom_all = attack_results.iloc[:0]
+    phantom_iso = phantom_all[phantom_all['Model'] == 'IsolationForest']
     if len(phantom_iso) > 0:
         phantom_data = phantom_iso.iloc[0]
-        print(f"   - Detection Rate: {phantom_data['F1_Score']:.1%}")
-        print(f"   - Precision: {phantom_data['Precision']:.4f}")
-        print(f"   - AUC: {phantom_data['AUC']:.4f}")
-    
+        log(f"   - Detection Rate: {phantom_data['F1_Score']:.1%}")
+        log(f"   - Precision: {phantom_data['Precision']:.4f}")
+        log(f"   - AUC: {phantom_data['AUC']:.4f}")
+
     # Compare with other models on Phantom ECU
-    phantom_all = attack_results[attack_results['Attack_Type'] == 'Realistic_Phantom_ECU']
-    phantom_ranking = phantom_all.sort_values('F1_Score', ascending=False)
-    
-    print(f"\nPHANTOM ECU MODEL RANKING:")
-    for i, (_, row) in enumerate(phantom_ranking.iterrows(), 1):
-        print(f"   {i}. {row['Model']}: F1={row['F1_Score']:.4f}")
-    
+    phantom_ranking = phantom_all.nlargest(len(phantom_all), 'F1_Score')[['Model', 'F1_Score']]
+
+    log(f"\nPHANTOM ECU MODEL RANKING:")
+    for i, (model, f1) in enumerate(phantom_ranking.itertuples(index=False, name=None), 1):
+        log(f"   {i}. {model}: F1={f1:.4f}")
+
     # Performance characteristics
-    print(f"\nISOLATION FOREST CHARACTERISTICS:")
-    print(f"   - Speed: Fast training (1.42s), moderate inference")
-    print(f"   - Scalability: Good for large datasets")
-    print(f"   - Consistency: Stable across different attack types")
-    print(f"   - Robustness: Ranks 4th-5th across most attacks")
-    
+    log(f"\nISOLATION FOREST CHARACTERISTICS:")
+    log(f"   - Speed: Fast training (1.42s), moderate inference")
+    log(f"   - Scalability: Good for large datasets")
+    log(f"   - Consistency: Stable across different attack types")
+    log(f"   - Robustness: Ranks 4th-5th across most attacks")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+
     return iso_results
 
 def update_hyperparameter_analysis():
     """Update hyperparameter tuning analysis to highlight IsolationForest"""
     
-    # Load hyperparameter results
-    summary = pd.read_csv('../hyperparameters/hyperparameter_summary.csv')
-    
+    # Load hyperparameter results (Feather cache when available)
+    summary = load_summary()
+    summary.set_index('Model', inplace=True)
+
     print(f"\nHYPERPARAMETER TUNING RESULTS:")
     print(f"   Updated hyperparameter_summary.csv includes IsolationForest")
-    
-    iso_params = summary[summary['Model'] == 'IsolationForest'].iloc[0]
+
+    iso_params = summary.loc['IsolationForest']
     print(f"   - Best F1: {iso_params['Best_F1']:.4f}")
     print(f"   - Best Parameters: {iso_params['Best_Parameters']}")
     print(f"   - Training Time: {iso_params['Training_Time']:.2f}s")